@@ -1,27 +1,271 @@
-from flask import Flask, jsonify, render_template, send_from_directory, request
+from flask import Flask, Response, jsonify, make_response, render_template, send_from_directory, request, stream_with_context
+from flask.json.provider import JSONProvider
+from flask_caching import Cache
+from flask_compress import Compress
 import os
+import time
+import atexit
+import hashlib
+import csv
+import threading
+from contextlib import contextmanager
+from io import BytesIO, StringIO
+from datetime import date, datetime, timezone
+from functools import wraps
+from decimal import Decimal
+import orjson
+import pyarrow as pa
+import pyarrow.parquet as pq
 import psycopg2
 import psycopg2.extras
+import psycopg2.pool
+from psycopg2 import sql
 from dotenv import load_dotenv
 
 # Cargar variables de entorno
 load_dotenv()
 
+def _orjson_default(obj):
+    """Convierte los tipos que orjson no serializa de forma nativa"""
+    # Las columnas NUMERIC llegan desde psycopg2 como Decimal
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, (date, datetime)):
+        return obj.isoformat()
+    raise TypeError(f"Tipo no serializable: {type(obj).__name__}")
+
+def orjson_dumps(obj):
+    """Serializa un objeto a bytes JSON con orjson"""
+    return orjson.dumps(
+        obj,
+        option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC,
+        default=_orjson_default
+    )
+
+class OrjsonProvider(JSONProvider):
+    """Proveedor JSON de Flask basado en orjson"""
+
+    def dumps(self, obj, **kwargs):
+        return orjson_dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
+
+# Compresión de respuestas: Brotli preferido, gzip como alternativa
+app.config["COMPRESS_ALGORITHM"] = ["br", "gzip"]
+app.config["COMPRESS_MIN_SIZE"] = 1024
+app.config["COMPRESS_LEVEL"] = 4
+# No comprimir respuestas transmitidas: Flask-Compress las leería completas en memoria
+app.config["COMPRESS_STREAMS"] = False
+Compress(app)
+
+# Caché de respuestas: Redis si está configurado, memoria local en caso contrario.
+# data_extractor.py elimina las claves con este prefijo tras cada carga.
+CACHE_KEY_PREFIX = "cbr:"
+REDIS_URL = os.getenv("REDIS_URL")
+# La caché local vive en cada proceso de gunicorn y el extractor no puede
+# invalidarla, así que se usa un TTL corto para limitar datos desactualizados
+CACHE_TIMEOUT = 3600 if REDIS_URL else int(os.getenv("LOCAL_CACHE_TIMEOUT", "60"))
+if not REDIS_URL:
+    app.logger.warning(
+        "REDIS_URL no definido: se usa una caché local por proceso con TTL de %s s", CACHE_TIMEOUT
+    )
+cache = Cache(app, config={
+    "CACHE_TYPE": "RedisCache" if REDIS_URL else "SimpleCache",
+    "CACHE_REDIS_URL": REDIS_URL,
+    "CACHE_KEY_PREFIX": CACHE_KEY_PREFIX,
+    "CACHE_DEFAULT_TIMEOUT": CACHE_TIMEOUT
+})
+
+def _cacheable(response):
+    """Solo se guardan en caché las respuestas exitosas y no transmitidas por partes"""
+    return getattr(response, "status_code", None) == 200 and not response.is_streamed
 
-def get_db_connection():
-    """Establece conexión con la base de datos PostgreSQL"""
+def get_db_config():
+    """Retorna los parámetros de conexión a PostgreSQL según el entorno"""
     db_url = os.getenv("DATABASE_URL")
     if db_url:
-        return psycopg2.connect(db_url)
-    
-    return psycopg2.connect(
-        host=os.getenv("DB_HOST", "localhost"),
-        port=os.getenv("DB_PORT", "5432"),
-        database=os.getenv("DB_NAME", "postgres"),
-        user=os.getenv("DB_USER", "postgres"),
-        password=os.getenv("DB_PASSWORD", "")
-    )
+        return {"dsn": db_url}
+
+    return {
+        "host": os.getenv("DB_HOST", "localhost"),
+        "port": os.getenv("DB_PORT", "5432"),
+        "database": os.getenv("DB_NAME", "postgres"),
+        "user": os.getenv("DB_USER", "postgres"),
+        "password": os.getenv("DB_PASSWORD", "")
+    }
+
+# Pool de conexiones compartido por todo el proceso. gunicorn.conf.py calcula
+# DB_POOL_MAX a partir del número de trabajadores y de DB_MAX_CONNECTIONS.
+DB_POOL_MAX = int(os.getenv("DB_POOL_MAX", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+# minconn=0: las conexiones se abren al primer uso, así el proceso arranca aunque
+# PostgreSQL no esté disponible y /api/health puede informar el estado
+POOL = psycopg2.pool.ThreadedConnectionPool(
+    minconn=0,
+    maxconn=DB_POOL_MAX,
+    **get_db_config()
+)
+atexit.register(POOL.closeall)
+# getconn falla de inmediato si el pool está agotado; el semáforo hace que las
+# peticiones esperen su turno (con gevent, threading está parcheado y la espera cede)
+POOL_SLOTS = threading.BoundedSemaphore(DB_POOL_MAX)
+
+@contextmanager
+def db_cursor(dict_cursor=True, name=None):
+    """Toma una conexión del pool y entrega un cursor, devolviéndola al terminar
+
+    Si se indica `name` se abre un cursor del lado del servidor.
+    """
+    if not POOL_SLOTS.acquire(timeout=DB_POOL_TIMEOUT):
+        raise psycopg2.pool.PoolError("Tiempo de espera agotado para obtener una conexión")
+    try:
+        conn = POOL.getconn()
+        try:
+            cursor_factory = psycopg2.extras.RealDictCursor if dict_cursor else None
+            with conn.cursor(name=name, cursor_factory=cursor_factory) as cur:
+                yield cur
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            POOL.putconn(conn)
+    finally:
+        POOL_SLOTS.release()
+
+# Filas que el cursor del servidor trae por cada viaje a la base de datos
+STREAM_ITERSIZE = 500
+# Tamaño aproximado de cada bloque de ?format=csv enviado al cliente
+CSV_CHUNK_SIZE = 64 * 1024
+# Máximo de registros por página en /api/birth-rates
+MAX_LIMIT = int(os.getenv("MAX_PAGE_LIMIT", 500))
+# Máximo OFFSET aceptado con ?page; más allá se debe usar la paginación por cursor
+MAX_OFFSET = int(os.getenv("MAX_PAGE_OFFSET", 100000))
+# Vista materializada con el resumen anual, creada por data_extractor.py
+SUMMARY_VIEW = "crude_birth_rate_yearly_summary"
+
+def stream_response(gen, mimetype):
+    """Ejecuta el generador hasta su primer bloque y transmite el resto
+
+    Así los errores de la consulta se producen antes de enviar la respuesta
+    y el endpoint puede devolver un 500 con su mensaje habitual.
+    """
+    first = next(gen)
+
+    def stream():
+        yield first
+        yield from gen
+
+    return Response(stream_with_context(stream()), mimetype=mimetype)
+
+# Caché del total de registros; solo cambia cuando se vuelve a ejecutar data_extractor.py
+COUNT_CACHE_TTL = 300
+_COUNT_CACHE = {"v": None, "ts": 0}
+
+def get_row_count(cur, exact=False):
+    """Retorna el total de registros, estimado por defecto o exacto si se solicita"""
+    if exact:
+        cur.execute("SELECT COUNT(*) AS total FROM crude_birth_rate")
+        return cur.fetchone()['total']
+
+    if _COUNT_CACHE["v"] is None or time.monotonic() - _COUNT_CACHE["ts"] > COUNT_CACHE_TTL:
+        # Estimación del planificador: no recorre la tabla
+        cur.execute("SELECT reltuples::bigint AS total FROM pg_class WHERE relname = 'crude_birth_rate'")
+        row = cur.fetchone()
+        total = row['total'] if row else -1
+        if total < 0:
+            # Tabla sin estadísticas (nunca analizada): recurrir al conteo exacto
+            cur.execute("SELECT COUNT(*) AS total FROM crude_birth_rate")
+            total = cur.fetchone()['total']
+        _COUNT_CACHE["v"] = total
+        _COUNT_CACHE["ts"] = time.monotonic()
+    return _COUNT_CACHE["v"]
+
+def _dataset_version():
+    """Retorna la versión de los datos (MAX(import_date) como timestamp), cacheada"""
+    # La clave comparte el prefijo de la caché, así data_extractor.py la invalida tras cada carga
+    version = cache.get("dataset_version")
+    if version is None:
+        with db_cursor(dict_cursor=False) as cur:
+            cur.execute("SELECT MAX(import_date) FROM crude_birth_rate")
+            import_date = cur.fetchone()[0]
+        if import_date is None:
+            return None
+        version = import_date.replace(tzinfo=timezone.utc).timestamp()
+        cache.set("dataset_version", version)
+    return version
+
+def conditional_on_dataset(view):
+    """Agrega ETag/Last-Modified según la versión de los datos y responde 304 si no cambiaron"""
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        try:
+            version = _dataset_version()
+        except Exception:
+            version = None
+        if version is None:
+            return view(*args, **kwargs)
+
+        etag = hashlib.md5(f"{request.full_path}:{version}".encode()).hexdigest()
+        last_modified = datetime.fromtimestamp(int(version), tz=timezone.utc)
+        # Flask-Compress agrega ":<algoritmo>" al ETag de las respuestas comprimidas
+        client_etags = {tag.split(':')[0] for tag in request.if_none_match.as_set(include_weak=True)}
+        not_modified = etag in client_etags or (
+            not request.if_none_match
+            and request.if_modified_since is not None
+            and last_modified <= request.if_modified_since
+        )
+
+        response = Response(status=304) if not_modified else make_response(view(*args, **kwargs))
+        if response.status_code in (200, 304):
+            response.set_etag(etag)
+            response.last_modified = last_modified
+            response.cache_control.max_age = 60
+        return response
+    return wrapper
+
+def csv_stream(query, params):
+    """Genera el resultado de una consulta como CSV leyendo de un cursor del servidor"""
+    with db_cursor(dict_cursor=False, name="cbr_csv") as cur:
+        cur.itersize = STREAM_ITERSIZE
+        cur.execute(query, params)
+        rows = iter(cur)
+        # En cursores del servidor la descripción solo existe tras la primera lectura
+        first = next(rows, None)
+
+        buffer = StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow([d[0] for d in cur.description])
+        if first is not None:
+            writer.writerow(first)
+
+        def flush():
+            data = buffer.getvalue().encode('utf-8')
+            buffer.seek(0)
+            buffer.truncate()
+            return data
+
+        yield flush()
+        for row in rows:
+            writer.writerow(row)
+            if buffer.tell() >= CSV_CHUNK_SIZE:
+                yield flush()
+        yield flush()
+
+def parquet_response(query, params):
+    """Retorna el resultado de una consulta como archivo Parquet"""
+    with db_cursor(dict_cursor=False) as cur:
+        cur.execute(query, params)
+        rows = cur.fetchall()
+        colnames = [d[0] for d in cur.description]
+    table = pa.table({name: [row[i] for row in rows] for i, name in enumerate(colnames)})
+    buffer = BytesIO()
+    pq.write_table(table, buffer)
+    return Response(buffer.getvalue(), mimetype="application/vnd.apache.parquet")
 
 @app.route('/')
 def index_page():
@@ -39,46 +283,124 @@ def api_index():
             "/api/birth-rates/countries",
             "/api/birth-rates/country/<code>",
             "/api/birth-rates/years"
-        ]
+        ],
+        "max_page_limit": MAX_LIMIT,
+        "max_page_offset": MAX_OFFSET,
+        "formats": {
+            "json": "por defecto; limit hasta max_page_limit",
+            "compact": "JSON con filas como listas; limit hasta max_page_limit",
+            "parquet": "limit hasta max_page_limit",
+            "csv": "transmitido por partes; sin limit exporta todas las filas"
+        }
     })
 
 @app.route('/api/birth-rates')
 def get_birth_rates():
     """Retorna datos de tasas de natalidad con paginación"""
+    # format=compact devuelve filas como listas más la lista de columnas;
+    # format=csv y format=parquet evitan JSON para consumidores masivos
+    data_format = request.args.get('format')
+    compact = data_format == 'compact'
+
     page = request.args.get('page', 1, type=int)
-    limit = request.args.get('limit', 100, type=int)
-    offset = (page - 1) * limit
+    limit = request.args.get('limit', type=int)
+    if data_format == 'csv':
+        # CSV se transmite por partes: no aplica MAX_LIMIT y sin limit se exportan todas las filas
+        limit = max(1, limit) if limit is not None else None
+    else:
+        limit = 100 if limit is None else limit
+        # strict=true rechaza un limit fuera de rango en lugar de ajustarlo
+        if limit > MAX_LIMIT and request.args.get('strict') == 'true':
+            return jsonify({"error": "limit too large", "max_limit": MAX_LIMIT}), 400
+        limit = max(1, min(limit, MAX_LIMIT))
+    page = max(1, page)
+    offset = (page - 1) * limit if limit else 0
+    if offset > MAX_OFFSET:
+        return jsonify({
+            "error": "page out of range; use after_entity/after_year/after_id",
+            "max_offset": MAX_OFFSET
+        }), 400
+    # Paginación por cursor (keyset): continúa después de (after_entity, after_year, after_id);
+    # id desempata filas repetidas de (entity, year)
+    cursor_args = ('after_entity', 'after_year', 'after_id')
+    use_cursor = any(arg in request.args for arg in cursor_args)
+    after_entity = request.args.get('after_entity')
+    after_year = request.args.get('after_year', type=int)
+    after_id = request.args.get('after_id', type=int)
+    if use_cursor and (after_entity is None or after_year is None or after_id is None):
+        return jsonify({
+            "error": "after_entity, after_year y after_id deben enviarse juntos (year e id enteros)"
+        }), 400
+    # count=false omite el total; count=true fuerza un COUNT(*) exacto
+    count_arg = request.args.get('count')
+    exact_count = count_arg == 'true'
     
-    conn = get_db_connection()
+    if use_cursor:
+        query = """
+            SELECT * FROM crude_birth_rate
+            WHERE (entity, year, id) > (%s, %s, %s)
+            ORDER BY entity, year, id
+            LIMIT %s
+        """
+        params = (after_entity, after_year, after_id, limit)
+    else:
+        query = "SELECT * FROM crude_birth_rate ORDER BY entity, year, id LIMIT %s OFFSET %s"
+        params = (limit, offset)
+
+    if data_format in ('csv', 'parquet'):
+        try:
+            if data_format == 'csv':
+                return stream_response(csv_stream(query, params), "text/csv")
+            return parquet_response(query, params)
+        except Exception as e:
+            return jsonify({"error": str(e)}), 500
+
+    response = {"limit": limit}
+    if not use_cursor:
+        response["page"] = page
     try:
-        with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
-            # Obtener datos con paginación
-            cur.execute("SELECT * FROM crude_birth_rate ORDER BY entity, year LIMIT %s OFFSET %s", 
-                       (limit, offset))
-            results = cur.fetchall()
-            
+        if count_arg != 'false':
             # Obtener el total de registros para la paginación
-            cur.execute("SELECT COUNT(*) FROM crude_birth_rate")
-            total = cur.fetchone()['count']
-            
-            return jsonify({
-                "page": page,
-                "limit": limit,
-                "total": total,
-                "total_pages": (total + limit - 1) // limit,
-                "data": results
-            })
+            with db_cursor() as cur:
+                total = get_row_count(cur, exact=exact_count)
+            response["total"] = total
+            response["total_pages"] = (total + limit - 1) // limit
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+    try:
+        # Las páginas están limitadas a MAX_LIMIT filas: se arma una respuesta normal
+        # para que Flask-Compress pueda comprimirla
+        with db_cursor(dict_cursor=not compact) as cur:
+            cur.execute(query, params)
+            results = cur.fetchall()
+            colnames = [d[0] for d in cur.description]
     except Exception as e:
         return jsonify({"error": str(e)}), 500
-    finally:
-        conn.close()
+
+    response["data"] = results
+    last_row = results[-1] if results else None
+    if compact:
+        response["columns"] = colnames
+        if last_row is not None:
+            last_row = dict(zip(colnames, last_row))
+
+    response["next_cursor"] = None
+    if len(results) == limit:
+        response["next_cursor"] = {
+            "after_entity": last_row['entity'],
+            "after_year": last_row['year'],
+            "after_id": last_row['id']
+        }
+    return jsonify(response)
 
 @app.route('/api/birth-rates/countries')
+@conditional_on_dataset
+@cache.cached(timeout=CACHE_TIMEOUT, response_filter=_cacheable)
 def get_countries():
     """Retorna lista de países disponibles"""
-    conn = get_db_connection()
     try:
-        with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
+        with db_cursor() as cur:
             # Obtener países únicos con sus códigos
             cur.execute("""
                 SELECT DISTINCT entity, code 
@@ -90,85 +412,117 @@ def get_countries():
             return jsonify(results)
     except Exception as e:
         return jsonify({"error": str(e)}), 500
-    finally:
-        conn.close()
 
 @app.route('/api/birth-rates/country/<code>')
+@cache.cached(query_string=True, response_filter=_cacheable)
 def get_country_data(code):
     """Retorna datos de un país específico por código"""
-    conn = get_db_connection()
+    data_format = request.args.get('format')
+    if data_format in ('csv', 'parquet'):
+        query = "SELECT * FROM crude_birth_rate WHERE code = %s ORDER BY year"
+        try:
+            if data_format == 'csv':
+                return stream_response(csv_stream(query, (code,)), "text/csv")
+            return parquet_response(query, (code,))
+        except Exception as e:
+            return jsonify({"error": str(e)}), 500
+
     try:
-        with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
+        with db_cursor(dict_cursor=False) as cur:
+            # El JSON completo se construye en PostgreSQL y se devuelve tal cual
             cur.execute("""
-                SELECT * FROM crude_birth_rate 
-                WHERE code = %s 
-                ORDER BY year
-            """, (code,))
-            results = cur.fetchall()
-            if not results:
+                SELECT json_build_object(
+                    'country', MIN(t.entity),
+                    'code', %s,
+                    'year_range', MIN(t.year) || '-' || MAX(t.year),
+                    'data_points', COUNT(*),
+                    'data', json_agg(row_to_json(t) ORDER BY t.year)
+                )::text
+                FROM crude_birth_rate t
+                WHERE t.code = %s
+                HAVING COUNT(*) > 0
+            """, (code, code))
+            result = cur.fetchone()
+            if result is None:
                 return jsonify({"error": "País no encontrado"}), 404
             
-            # Obtener información general del país
-            country_name = results[0]['entity']
-            year_min = results[0]['year']
-            year_max = results[-1]['year']
-            
-            return jsonify({
-                "country": country_name,
-                "code": code,
-                "year_range": f"{year_min}-{year_max}",
-                "data_points": len(results),
-                "data": results
-            })
+            return Response(result[0], mimetype="application/json")
     except Exception as e:
         return jsonify({"error": str(e)}), 500
-    finally:
-        conn.close()
 
 @app.route('/api/birth-rates/years')
+@conditional_on_dataset
+@cache.cached(timeout=CACHE_TIMEOUT, response_filter=_cacheable)
 def get_years_range():
     """Retorna el rango de años disponibles en la base de datos"""
-    conn = get_db_connection()
     try:
-        with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
+        with db_cursor() as cur:
             cur.execute("SELECT MIN(year) as min_year, MAX(year) as max_year FROM crude_birth_rate")
             result = cur.fetchone()
             return jsonify(result)
     except Exception as e:
         return jsonify({"error": str(e)}), 500
-    finally:
-        conn.close()
+
+def _summary_source(cur):
+    """
+    Devuelve la relación con el resumen anual: la vista materializada que
+    data_extractor.py refresca tras cada carga o, si aún no existe, la agregación en vivo
+    """
+    cur.execute("SELECT to_regclass(%s) IS NOT NULL", (SUMMARY_VIEW,))
+    if cur.fetchone()[0]:
+        return sql.Identifier(SUMMARY_VIEW)
+    # La columna de la tasa es la primera que no es de identificación (igual que en data_extractor.py)
+    cur.execute("""
+        SELECT column_name FROM information_schema.columns
+        WHERE table_schema = current_schema() AND table_name = 'crude_birth_rate'
+          AND column_name NOT IN ('id', 'entity', 'code', 'year', 'import_date')
+        ORDER BY ordinal_position
+        LIMIT 1
+    """)
+    row = cur.fetchone()
+    if row is None:
+        raise LookupError("No se encontró la columna de la tasa de natalidad")
+    return sql.SQL("""(
+        SELECT year,
+               AVG({rate}) as average_rate,
+               MIN({rate}) as min_rate,
+               MAX({rate}) as max_rate,
+               COUNT(*) as country_count
+        FROM crude_birth_rate
+        GROUP BY year
+    )""").format(rate=sql.Identifier(row[0]))
 
 @app.route('/api/birth-rates/summary')
+@conditional_on_dataset
+@cache.cached(timeout=CACHE_TIMEOUT, query_string=True, response_filter=_cacheable)
 def get_summary_statistics():
     """Retorna estadísticas resumidas de tasas de natalidad por año"""
-    conn = get_db_connection()
+    if request.args.get('format') == 'compact':
+        # Formato compacto: lista de columnas y filas como listas
+        select = """
+            SELECT json_build_object(
+                'columns', json_build_array('year', 'average_rate', 'min_rate', 'max_rate', 'country_count'),
+                'data', coalesce(json_agg(json_build_array(
+                    r.year, r.average_rate, r.min_rate, r.max_rate, r.country_count
+                ) ORDER BY r.year), '[]')
+            )::text
+        """
+    else:
+        select = "SELECT coalesce(json_agg(row_to_json(r) ORDER BY r.year), '[]')::text"
     try:
-        with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
-            cur.execute("""
-                SELECT 
-                    year,
-                    AVG(crude_birth_rate) as average_rate,
-                    MIN(crude_birth_rate) as min_rate,
-                    MAX(crude_birth_rate) as max_rate,
-                    COUNT(*) as country_count
-                FROM crude_birth_rate
-                GROUP BY year
-                ORDER BY year
-            """)
-            results = cur.fetchall()
-            return jsonify(results)
+        with db_cursor(dict_cursor=False) as cur:
+            cur.execute(sql.SQL(select + " FROM {} r").format(_summary_source(cur)))
+            result = cur.fetchone()[0]
+            return Response(result, mimetype="application/json")
     except Exception as e:
         return jsonify({"error": str(e)}), 500
-    finally:
-        conn.close()
 
 @app.route('/api/health')
 def health_check():
     """Endpoint para verificar el estado de la API"""
     try:
-        conn = get_db_connection()
-        conn.close()
+        with db_cursor(dict_cursor=False) as cur:
+            cur.execute("SELECT 1")
         return jsonify({"status": "healthy", "database": "connected"})
     except Exception as e:
         return jsonify({"status": "unhealthy", "database": "disconnected", "error": str(e)}), 500
@@ -184,6 +538,8 @@ def server_error(e):
     return jsonify({"error": "Error interno del servidor", "details": str(e)}), 500
 
 if __name__ == '__main__':
+    # El servidor de Flask solo se usa en desarrollo; en producción: gunicorn -c gunicorn.conf.py app:app
+    if os.getenv('FLASK_ENV') != 'development':
+        raise SystemExit("Use gunicorn -c gunicorn.conf.py app:app o defina FLASK_ENV=development")
     port = int(os.getenv('PORT', 5000))
-    debug = os.getenv('FLASK_ENV') == 'development'
-    app.run(host='0.0.0.0', port=port, debug=debug)
\ No newline at end of file
+    app.run(host='0.0.0.0', port=port, debug=True)
\ No newline at end of file
@@ -2,11 +2,14 @@
 import os
 import requests
 import pandas as pd
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
+from itertools import chain
 import psycopg2
+import redis
 from psycopg2 import sql
-from io import StringIO
-from datetime import datetime
+from io import BytesIO
 
 # Configuración de logging
 tk = logging.getLogger()
@@ -22,6 +25,53 @@ if not tk.handlers:
     tk.addHandler(stream_handler)
 logger = logging.getLogger("birth_rate_extractor")
 
+# Tipos de pandas -> tipos de PostgreSQL usados al crear la tabla
+TYPE_MAP = {
+    'int64': 'INTEGER',
+    'float64': 'NUMERIC',
+    'object': 'TEXT',
+    'bool': 'BOOLEAN',
+    'datetime64[ns]': 'TIMESTAMP'
+}
+
+def _clean_columns(columns):
+    # Convertir nombres de columna a snake_case y solo caracteres alfanuméricos + '_'
+    return columns.str.strip().str.lower().str.replace(r'[^a-z0-9_]', '_', regex=True)
+
+# Sesión HTTP reutilizable (keep-alive) con reintentos ante errores transitorios
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=4,
+    max_retries=Retry(total=5, backoff_factor=0.5, status_forcelist=[502, 503, 504])
+))
+HTTP_TIMEOUT = (5, 30)
+
+# Bytes (y filas) del inicio del CSV usados para inferir los tipos de columna
+SAMPLE_BYTES = 1024 * 1024
+SAMPLE_ROWS = 5000
+STREAM_CHUNK_SIZE = 64 * 1024
+
+class _ChunkReader:
+    """Adapta un iterador de bloques de bytes a un objeto tipo archivo para copy_expert"""
+
+    def __init__(self, chunks):
+        self._chunks = chunks
+        self._chunk = b''
+        self._offset = 0
+
+    def read(self, size=-1):
+        # Devuelve como máximo el resto del bloque actual, sin copiar el búfer completo
+        while self._offset >= len(self._chunk):
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return b''
+            self._chunk, self._offset = chunk, 0
+        end = len(self._chunk) if size < 0 else self._offset + size
+        data = self._chunk[self._offset:end]
+        self._offset += len(data)
+        return data
+
 class CSVtoPostgresExtractor:
     def __init__(self, csv_url: str, table_name: str):
         """
@@ -33,8 +83,10 @@ class CSVtoPostgresExtractor:
         """
         self.csv_url = csv_url
         self.table_name = table_name
-        self.df = None
         self.conn = None
+        # Esquema (nombres saneados y tipos de pandas) usado por create_table
+        self._columns = None
+        self._dtypes = None
 
     def _load_env_config(self):
         # Lectura de configuración desde variables de entorno
@@ -62,50 +114,53 @@ class CSVtoPostgresExtractor:
             logger.error(f"Error al conectar con PostgreSQL: {e}")
             return False
 
-    def fetch_csv(self) -> bool:
-        """
-        Descarga y carga el CSV en un DataFrame de pandas
-        """
+    def _infer_schema(self, head: bytes):
+        # Inferir nombres y tipos a partir de las primeras filas, sin leer el CSV completo
+        sample_end = head.rfind(b'\n') + 1 or len(head)
+        sample = pd.read_csv(BytesIO(head[:sample_end]), nrows=SAMPLE_ROWS)
+        self._columns = list(_clean_columns(sample.columns))
+        dtypes = pd.Series(sample.dtypes.values, index=self._columns)
+        # La muestra solo cubre el inicio del archivo: lo que no se ve en ella se ensancha
+        # para que el COPY no falle con valores que aparecen más adelante
+        for col, raw in zip(self._columns, sample.columns):
+            if sample[raw].isna().all():
+                # Columna vacía en la muestra: pandas la infiere float64, pero puede traer texto
+                dtypes[col] = 'object'
+            elif str(dtypes[col]) == 'int64' and col != 'year':
+                # Enteros en la muestra pueden tener decimales más adelante
+                dtypes[col] = 'float64'
+        self._dtypes = dtypes
+
+    def _value_column(self):
+        # Columna con la tasa de natalidad: la que no es entity, code ni year
+        for col in self._columns or []:
+            if col not in ('entity', 'code', 'year'):
+                return col
+        return None
+
+    def _execute_optional(self, cur, stmt, description):
+        # Ejecuta DDL auxiliar (índices, vistas) sin abortar la transacción si falla
+        cur.execute("SAVEPOINT optional_ddl")
         try:
-            logger.info(f"Descargando CSV desde: {self.csv_url}")
-            resp = requests.get(self.csv_url, timeout=30)
-            resp.raise_for_status()
-            self.df = pd.read_csv(StringIO(resp.text))
-            rows, cols = self.df.shape
-            logger.info(f"CSV cargado: {rows} filas x {cols} columnas")
+            cur.execute(stmt)
+            cur.execute("RELEASE SAVEPOINT optional_ddl")
             return True
         except Exception as e:
-            logger.error(f"Error al obtener el CSV: {e}")
+            cur.execute("ROLLBACK TO SAVEPOINT optional_ddl")
+            logger.warning(f"Error en {description}, se omite: {e}")
             return False
 
-    def _sanitize_columns(self):
-        # Convertir nombres de columna a snake_case y solo caracteres alfanuméricos + '_'
-        clean_cols = []
-        for col in self.df.columns:
-            name = col.strip().lower()
-            name = ''.join(c if c.isalnum() or c=='_' else '_' for c in name)
-            clean_cols.append(name)
-        self.df.columns = clean_cols
-
     def create_table(self) -> bool:
         """
         Crea la tabla si no existe, usando tipos inferidos de pandas
         """
-        if self.conn is None or self.df is None:
+        if self.conn is None or self._dtypes is None:
             logger.error("No hay conexión o datos para crear tabla")
             return False
         try:
-            self._sanitize_columns()
-            type_map = {
-                'int64': 'INTEGER',
-                'float64': 'NUMERIC',
-                'object': 'TEXT',
-                'bool': 'BOOLEAN',
-                'datetime64[ns]': 'TIMESTAMP'
-            }
             cols_defs = []
-            for col, dtype in self.df.dtypes.items():
-                pg_type = type_map.get(str(dtype), 'TEXT')
+            for col, dtype in self._dtypes.items():
+                pg_type = TYPE_MAP.get(str(dtype), 'TEXT')
                 cols_defs.append(sql.SQL("{} {}").format(
                     sql.Identifier(col), sql.SQL(pg_type)
                 ))
@@ -115,8 +170,50 @@ class CSVtoPostgresExtractor:
                 sql.Identifier(self.table_name),
                 sql.SQL(', ').join(cols_defs)
             )
+            # Índices para los filtros y ordenamientos de la API:
+            # country/<code> (code, year), paginación (entity, year, id) y resumen por año
+            value_col = self._value_column()
+            indexes = [
+                ("code_year_idx", sql.SQL("(code, year)")),
+                ("entity_year_id_idx", sql.SQL("(entity, year, id)"))
+            ]
+            if value_col:
+                indexes.append(("year_idx", sql.SQL("(year) INCLUDE ({})").format(sql.Identifier(value_col))))
+            index_stmts = [
+                sql.SQL("CREATE INDEX IF NOT EXISTS {} ON {} {}").format(
+                    sql.Identifier(f"{self.table_name}_{suffix}"),
+                    sql.Identifier(self.table_name),
+                    columns
+                )
+                for suffix, columns in indexes
+            ]
+            # Resumen anual precalculado para /api/birth-rates/summary
+            summary_name = sql.Identifier(f"{self.table_name}_yearly_summary")
+            summary_stmt = sql.SQL("""
+                CREATE MATERIALIZED VIEW IF NOT EXISTS {view} AS
+                SELECT
+                    year,
+                    AVG({value})::numeric AS average_rate,
+                    MIN({value}) AS min_rate,
+                    MAX({value}) AS max_rate,
+                    COUNT(*) AS country_count
+                FROM {table}
+                GROUP BY year
+            """).format(
+                view=summary_name,
+                value=sql.Identifier(value_col) if value_col else sql.SQL('NULL'),
+                table=sql.Identifier(self.table_name)
+            )
+            # El índice único permite REFRESH MATERIALIZED VIEW CONCURRENTLY
+            summary_index_stmt = sql.SQL("CREATE UNIQUE INDEX IF NOT EXISTS {} ON {} (year)").format(
+                sql.Identifier(f"{self.table_name}_yearly_summary_year_idx"), summary_name
+            )
             with self.conn.cursor() as cur:
                 cur.execute(stmt)
+                for index_stmt in index_stmts:
+                    self._execute_optional(cur, index_stmt, "índice")
+                if value_col and self._execute_optional(cur, summary_stmt, "vista de resumen anual"):
+                    self._execute_optional(cur, summary_index_stmt, "índice del resumen anual")
             self.conn.commit()
             logger.info(f"Tabla '{self.table_name}' creada/verificada")
             return True
@@ -125,35 +222,87 @@ class CSVtoPostgresExtractor:
             self.conn.rollback()
             return False
 
-    def bulk_insert(self) -> bool:
+    def stream_copy(self) -> bool:
         """
-        Inserta masivamente los datos usando COPY FROM STDIN
+        Descarga el CSV en streaming y lo envía directamente a COPY FROM STDIN,
+        usando solo el primer bloque para inferir los tipos y crear la tabla
         """
-        if self.conn is None or self.df is None:
-            logger.error("No hay conexión o datos para insertar")
+        if self.conn is None:
+            logger.error("No hay conexión para insertar")
             return False
         try:
-            self._sanitize_columns()
-            buffer = StringIO()
-            self.df.to_csv(buffer, index=False, header=False)
-            buffer.seek(0)
-
-            cols = [sql.Identifier(c) for c in self.df.columns]
-            copy_sql = sql.SQL("COPY {}({}) FROM STDIN WITH (FORMAT CSV)")
-            copy_stmt = copy_sql.format(
-                sql.Identifier(self.table_name), sql.SQL(', ').join(cols)
-            )
+            logger.info(f"Descargando CSV en streaming desde: {self.csv_url}")
+            with SESSION.get(self.csv_url, timeout=HTTP_TIMEOUT, stream=True) as resp:
+                resp.raise_for_status()
+                chunks = resp.iter_content(chunk_size=STREAM_CHUNK_SIZE)
 
-            with self.conn.cursor() as cur:
-                cur.copy_expert(copy_stmt.as_string(self.conn), buffer)
+                # Leer solo el primer bloque para inferir el esquema y crear la tabla
+                head = b''
+                for chunk in chunks:
+                    head += chunk
+                    if len(head) >= SAMPLE_BYTES:
+                        break
+                self._infer_schema(head)
+                if not self.create_table():
+                    return False
+
+                cols = [sql.Identifier(c) for c in self._columns]
+                copy_stmt = sql.SQL("COPY {}({}) FROM STDIN WITH (FORMAT CSV, HEADER TRUE)").format(
+                    sql.Identifier(self.table_name), sql.SQL(', ').join(cols)
+                )
+                # El bloque leído se antepone al resto de la descarga, sin volver a pedirla
+                reader = _ChunkReader(chain([head], chunks))
+                with self.conn.cursor() as cur:
+                    cur.copy_expert(copy_stmt.as_string(self.conn), reader, size=STREAM_CHUNK_SIZE)
+                    inserted = cur.rowcount
+                    self._after_load(cur)
             self.conn.commit()
-            logger.info(f"{len(self.df)} registros insertados en '{self.table_name}'")
+            logger.info(f"{inserted} registros insertados en '{self.table_name}'")
+            self._invalidate_api_cache()
             return True
+        except psycopg2.DataError as e:
+            # Un valor del CSV no encaja con el tipo inferido a partir de la muestra
+            logger.error(
+                f"Error en carga por streaming: {e} (tipos inferidos de las primeras "
+                f"{SAMPLE_ROWS} filas / {SAMPLE_BYTES} bytes; aumenta SAMPLE_ROWS o SAMPLE_BYTES)"
+            )
+            self.conn.rollback()
+            return False
         except Exception as e:
-            logger.error(f"Error en inserción masiva: {e}")
+            logger.error(f"Error en carga por streaming: {e}")
             self.conn.rollback()
             return False
 
+    def _after_load(self, cur):
+        # Actualizar estadísticas para que el planificador use los índices
+        cur.execute(sql.SQL("ANALYZE {}").format(sql.Identifier(self.table_name)))
+        # Recalcular el resumen anual con los datos recién cargados
+        summary_view = f"{self.table_name}_yearly_summary"
+        cur.execute("SELECT to_regclass(%s) IS NOT NULL", (summary_view,))
+        if not cur.fetchone()[0]:
+            return
+        concurrent_stmt = sql.SQL("REFRESH MATERIALIZED VIEW CONCURRENTLY {}").format(
+            sql.Identifier(summary_view)
+        )
+        if not self._execute_optional(cur, concurrent_stmt, "actualización concurrente del resumen anual"):
+            # Sin CONCURRENTLY la vista se bloquea durante el refresco, pero nunca queda desactualizada;
+            # si también falla, la carga completa se revierte
+            cur.execute(sql.SQL("REFRESH MATERIALIZED VIEW {}").format(sql.Identifier(summary_view)))
+
+    def _invalidate_api_cache(self):
+        # Elimina las respuestas cacheadas por la API (mismo prefijo que CACHE_KEY_PREFIX en app.py)
+        redis_url = os.getenv("REDIS_URL")
+        if not redis_url:
+            return
+        try:
+            client = redis.Redis.from_url(redis_url)
+            keys = list(client.scan_iter(match="cbr:*"))
+            if keys:
+                client.delete(*keys)
+            logger.info(f"Caché de la API invalidada: {len(keys)} claves eliminadas")
+        except Exception as e:
+            logger.error(f"Error al invalidar la caché de la API: {e}")
+
     def close(self):
         """Cierra la conexión con la base de datos"""
         if self.conn:
@@ -170,11 +319,7 @@ def main():
     if not extractor.connect():
         return
     try:
-        if not extractor.fetch_csv():
-            return
-        if not extractor.create_table():
-            return
-        if not extractor.bulk_insert():
+        if not extractor.stream_copy():
             return
         logger.info("Proceso completado con éxito")
     finally:
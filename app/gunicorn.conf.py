@@ -0,0 +1,39 @@
+# Configuración de gunicorn para producción
+import multiprocessing
+import os
+import sys
+
+bind = f"0.0.0.0:{os.getenv('PORT', '5000')}"
+# Conexiones a PostgreSQL disponibles para la API (por debajo de max_connections)
+db_max_connections = int(os.getenv("DB_MAX_CONNECTIONS", "90"))
+# Trabajadores proporcionales a los núcleos (WEB_CONCURRENCY permite ajustarlo),
+# siempre limitados para que cada uno tenga al menos 2 conexiones del presupuesto
+max_workers = max(1, db_max_connections // 2)
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count() * 2 + 1))
+if workers > max_workers:
+    print(
+        f"gunicorn: {workers} trabajadores exceden DB_MAX_CONNECTIONS={db_max_connections}; "
+        f"se usan {max_workers}",
+        file=sys.stderr
+    )
+    workers = max_workers
+# Cada trabajador tiene su propio pool: workers * DB_POOL_MAX <= DB_MAX_CONNECTIONS.
+# Los trabajadores se crean por fork y heredan esta variable.
+pool_max = max(2, db_max_connections // workers)
+if int(os.getenv("DB_POOL_MAX", pool_max)) * workers > db_max_connections:
+    print(
+        f"gunicorn: DB_POOL_MAX={os.environ['DB_POOL_MAX']} x {workers} trabajadores "
+        f"excede DB_MAX_CONNECTIONS={db_max_connections}",
+        file=sys.stderr
+    )
+os.environ.setdefault("DB_POOL_MAX", str(pool_max))
+worker_class = "gevent"
+# Las peticiones que superan el pool esperan en el semáforo de app.db_cursor
+worker_connections = int(os.getenv("WORKER_CONNECTIONS", "200"))
+# Sin preload: el pool se crea en cada trabajador después del fork
+preload_app = False
+
+def post_fork(server, worker):
+    # Permite que las esperas de psycopg2 cedan el control a otros greenlets
+    from psycogreen.gevent import patch_psycopg
+    patch_psycopg()